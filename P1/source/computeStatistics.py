@@ -2,14 +2,48 @@
 Number Stadistics
 This code converts calculates descriptive statistics (mean, median, mode, standard deviation, variance).
 """
+import math
 import sys
 import time
+import warnings
+from collections import Counter
+
+import numpy as np
+
+# Separator line reused by every results block
+SEPARATOR = "=" * 60
 
 
 def read_data_from_file(filename):
     """
-    Read numerical data from a file, handling invalid entries.
+    Read numerical data from a file into a float64 array, handling
+    invalid entries.
     """
+    try:
+        # Fast path: a clean file parses in one C-level call and lands
+        # directly in a compact float64 array. An empty file would emit
+        # a "no data" UserWarning before the clean error in main, so
+        # warnings are silenced here.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            arr = np.loadtxt(filename, dtype=np.float64,
+                             comments=None, ndmin=1)
+        # Multi-column files parse as 2-D; the stats only make sense on
+        # one value per line, so treat those like invalid input and let
+        # the line-by-line parser below reject them
+        if arr.ndim == 1:
+            return arr
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        sys.exit(1)
+    except PermissionError:
+        print(f"Error: Permission denied to read '{filename}'.")
+        sys.exit(1)
+    except ValueError:
+        # The file contains invalid entries; fall back to the filtered
+        # line-by-line parse so they can be reported and skipped
+        pass
+
     data = []
     invalid_count = 0
 
@@ -29,59 +63,53 @@ def read_data_from_file(filename):
         if invalid_count > 0:
             print(f"\nTotal invalid entries skipped: {invalid_count}\n")
 
-    except FileNotFoundError:
-        print(f"Error: File '{filename}' not found.")
-        sys.exit(1)
-    except PermissionError:
-        print(f"Error: Permission denied to read '{filename}'.")
-        sys.exit(1)
     except (IOError, OSError) as e:
         print(f"Error reading file: {e}")
         sys.exit(1)
 
-    return data
+    return np.asarray(data, dtype=np.float64)
 
 
-def calculate_mean(data):
+def calculate_mean_and_variance(arr):
     """
-    Calculate the arithmetic mean of a dataset.
+    Calculate the arithmetic mean and sample variance together.
 
     """
-    if not data:
-        return 0
+    n = arr.size
+    if n == 0:
+        return 0, 0
 
-    total = 0
-    for value in data:
-        total += value
+    mean = float(arr.mean())
+    if n <= 1:
+        return mean, 0
 
-    return total / len(data)
+    # Reusing the mean and reducing with np.dot (BLAS) fuses the two
+    # statistics into one sweep; arr.var() would recompute the mean and
+    # traverse the data again
+    deviations = arr - mean
+    variance = float(np.dot(deviations, deviations) / (n - 1))
 
+    return mean, variance
 
-def calculate_median(data):
+
+def calculate_median(arr):
     """
     Calculate the median of a dataset.
 
     """
-    if not data:
+    n = arr.size
+    if n == 0:
         return 0
 
-    # Sort the data using bubble sort
-    sorted_data = data.copy()
-    n = len(sorted_data)
-
-    for i in range(n):
-        for j in range(0, n - i - 1):
-            if sorted_data[j] > sorted_data[j + 1]:
-                sorted_data[j], sorted_data[j + 1] = \
-                    sorted_data[j + 1], sorted_data[j]
-
-    # Find median
+    # np.partition (introselect) places the kth order statistic in O(N)
+    # expected time, avoiding a full O(N log N) sort.
     if n % 2 == 0:
-        median = (sorted_data[n // 2 - 1] + sorted_data[n // 2]) / 2
+        partitioned = np.partition(arr, [n // 2 - 1, n // 2])
+        median = (partitioned[n // 2 - 1] + partitioned[n // 2]) / 2
     else:
-        median = sorted_data[n // 2]
+        median = np.partition(arr, n // 2)[n // 2]
 
-    return median
+    return float(median)
 
 
 def calculate_mode(data):
@@ -89,56 +117,18 @@ def calculate_mode(data):
     Calculate the mode of a dataset 
 
     """
-    if not data:
+    if len(data) == 0:
         return []
 
-    # Count frequencies and track first occurrence
-    frequency = {}
-    first_occurrence = {}
-
-    for index, value in enumerate(data):
-        if value not in frequency:
-            frequency[value] = 0
-            first_occurrence[value] = index
-        frequency[value] += 1
-
-    # Find maximum frequency
-    max_freq = 0
-    for freq in frequency.values():
-        max_freq = max(max_freq, freq)
+    # Counter counts in C; among tied counts most_common keeps the
+    # first-inserted value, which preserves the first-occurrence rule
+    top_value, top_freq = Counter(data).most_common(1)[0]
 
     # If all values appear only once, there's no mode
-    if max_freq == 1:
+    if top_freq == 1:
         return []
 
-    # Find the first occurring value with maximum frequency
-    first_mode = None
-    earliest_position = len(data)
-
-    for value, freq in frequency.items():
-        if freq == max_freq:
-            if first_occurrence[value] < earliest_position:
-                earliest_position = first_occurrence[value]
-                first_mode = value
-
-    return [first_mode] if first_mode is not None else []
-
-
-def calculate_variance(data, mean):
-    """
-    Calculate the variance of a dataset.
-
-    """
-    if len(data) <= 1:
-        return 0
-
-    sum_squared_diff = 0
-    for value in data:
-        diff = value - mean
-        sum_squared_diff += diff * diff
-
-    variance = sum_squared_diff / (len(data) - 1)
-    return variance
+    return [top_value]
 
 
 def calculate_std_deviation(variance):
@@ -146,21 +136,10 @@ def calculate_std_deviation(variance):
     Calculate the standard deviation from variance.
 
     """
-    # Calculate square root using Newton's method
-    if variance == 0:
+    if variance <= 0:
         return 0
 
-    # Initial guess
-    x = variance
-    epsilon = 1e-10
-
-    while True:
-        root = 0.5 * (x + variance / x)
-        if abs(root - x) < epsilon:
-            break
-        x = root
-
-    return root
+    return math.sqrt(variance)
 
 
 def format_results(stats_dict):
@@ -176,27 +155,27 @@ def format_results(stats_dict):
     variance = stats_dict['variance']
     elapsed_time = stats_dict['elapsed_time']
 
-    results = []
-    results.append("=" * 60)
-    results.append("DESCRIPTIVE STATISTICS RESULTS")
-    results.append("=" * 60)
-    results.append(f"Count of numbers: {len(data)}")
-    results.append(f"Mean: {mean:.4f}")
-    results.append(f"Median: {median:.4f}")
-
     if mode:
         mode_str = ", ".join([f"{m:.4f}" for m in sorted(mode)])
-        results.append(f"Mode: {mode_str}")
+        mode_line = f"Mode: {mode_str}"
     else:
-        results.append("Mode: No mode (all values appear once)")
-
-    results.append(f"Standard Deviation: {std_dev:.4f}")
-    results.append(f"Variance: {variance:.4f}")
-    results.append("=" * 60)
-    results.append(f"Elapsed Time: {elapsed_time:.6f} seconds")
-    results.append("=" * 60)
-
-    return "\n".join(results)
+        mode_line = "Mode: No mode (all values appear once)"
+
+    # One f-string builds the whole block in a single format pass
+    return (
+        f"{SEPARATOR}\n"
+        f"DESCRIPTIVE STATISTICS RESULTS\n"
+        f"{SEPARATOR}\n"
+        f"Count of numbers: {len(data)}\n"
+        f"Mean: {mean:.4f}\n"
+        f"Median: {median:.4f}\n"
+        f"{mode_line}\n"
+        f"Standard Deviation: {std_dev:.4f}\n"
+        f"Variance: {variance:.4f}\n"
+        f"{SEPARATOR}\n"
+        f"Elapsed Time: {elapsed_time:.6f} seconds\n"
+        f"{SEPARATOR}"
+    )
 
 
 def write_results_to_file(content, filename="StatisticsResults.txt"):
@@ -228,7 +207,7 @@ def main():
     # Read data from file
     data = read_data_from_file(filename)
 
-    if not data:
+    if data.size == 0:
         print("Error: No valid data found in the file.")
         sys.exit(1)
 
@@ -236,10 +215,9 @@ def main():
     print("Calculating statistics...\n")
 
     # Calculate statistics
-    mean = calculate_mean(data)
+    mean, variance = calculate_mean_and_variance(data)
     median = calculate_median(data)
     mode = calculate_mode(data)
-    variance = calculate_variance(data, mean)
     std_dev = calculate_std_deviation(variance)
 
     # End timing
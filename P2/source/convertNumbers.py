@@ -6,57 +6,76 @@ It processes input files containing decimal numbers and generates a formatted
 output file with conversion results.
 """
 
+import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 
+import numpy as np
 
-def decimal_to_binary(num):
-    """
-    Convert a decimal number to binary using basic algorithm.
-    Uses two's complement for negative numbers (32-bit).
-    """
-    if num == 0:
-        return "0"
-    # Handle negative numbers using two's complement (32-bit)
-    if num < 0:
-        # Two's complement: convert to 32-bit unsigned equivalent
-        num = (1 << 32) + num
-        # 2^32 + num (since num is negative)
-
-    # Convert to binary
-    binary = ""
-    temp = num
-    while temp > 0:
-        remainder = temp % 2
-        binary = str(remainder) + binary
-        temp = temp // 2
-
-    return binary
-
-
-def decimal_to_hexadecimal(num):
+# Separator lines reused by every output block
+SEPARATOR = "=" * 70
+DASH_LINE = "-" * 70
+
+# Lines per worker chunk; a file that fits in one chunk is converted
+# serially since pool startup would cost more than it saves
+CHUNK_LINES = 100000
+
+
+def convert_batch(numbers):
     """
-    Convert a decimal number to hexadecimal using basic algorithm.
+    Convert a batch of decimal numbers to binary and hexadecimal strings.
     Uses two's complement for negative numbers (32-bit).
+
+    Args:
+        numbers: List of integers to convert
+
+    Returns:
+        tuple: (binaries, hexadecimals) lists of digit strings
     """
-    if num == 0:
-        return "0"
-    # Handle negative numbers using two's complement (32-bit)
-    if num < 0:
-        # Two's complement: convert to 32-bit unsigned equivalent
-        num = (1 << 32) + num  # 2^32 + num (since num is negative)
+    binaries = [None] * len(numbers)
+    hexadecimals = [None] * len(numbers)
+
+    # The vectorized path only handles values whose two's-complement
+    # form fits in 32 bits; anything else keeps Python's
+    # arbitrary-precision format() so it is never truncated and the
+    # int64 conversion below cannot overflow
+    in_range_indexes = []
+    in_range_values = []
+
+    for index, num in enumerate(numbers):
+        if -(1 << 31) <= num < (1 << 32):
+            in_range_indexes.append(index)
+            in_range_values.append(num)
+        else:
+            binaries[index] = format(num, 'b')
+            hexadecimals[index] = format(num, 'X')
+
+    if in_range_values:
+        # Masking to 32 bits maps negatives to their two's complement
+        # representation; the bit/nibble expansion then runs in C over
+        # the whole batch instead of one Python loop iteration per digit.
+        unsigned = (np.asarray(in_range_values, dtype=np.int64)
+                    & 0xFFFFFFFF).astype(np.uint32)
 
-    # Hex digits mapping
-    hex_digits = "0123456789ABCDEF"
+        bit_shifts = np.arange(31, -1, -1, dtype=np.uint32)
+        bits = ((unsigned[:, None] >> bit_shifts)
+                & 1).astype(np.uint8) + ord('0')
 
-    hexadecimal = ""
-    temp = num
-    while temp > 0:
-        remainder = temp % 16
-        hexadecimal = hex_digits[remainder] + hexadecimal
-        temp = temp // 16
+        nibble_shifts = np.arange(28, -1, -4, dtype=np.uint32)
+        hex_table = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+        nibbles = hex_table[(unsigned[:, None] >> nibble_shifts) & 0xF]
 
-    return hexadecimal
+        # Each row is the fixed-width ASCII representation of one
+        # number; strip leading zeros to match the usual compact form.
+        for index, row in zip(in_range_indexes, bits):
+            binaries[index] = row.tobytes().decode('ascii').lstrip('0') or '0'
+        for index, row in zip(in_range_indexes, nibbles):
+            hexadecimals[index] = (row.tobytes().decode('ascii').lstrip('0')
+                                   or '0')
+
+    return binaries, hexadecimals
 
 
 def validate_and_convert(value):
@@ -93,30 +112,33 @@ def write_output_file(output_filename, results, errors, stats):
         errors: List of error messages
         stats: Dictionary containing total_processed, total_errors, elapsed_time
     """
-    with open(output_filename, 'w', encoding='utf-8') as outfile:
-        outfile.write("=" * 70 + "\n")
-        outfile.write("NUMBER BASE CONVERSION RESULTS\n")
-        outfile.write("=" * 70 + "\n\n")
-
-        if results:
-            for result in results:
-                outfile.write(result + "\n")
-        else:
-            outfile.write("No valid numbers were processed.\n")
+    parts = [
+        SEPARATOR,
+        "NUMBER BASE CONVERSION RESULTS",
+        SEPARATOR + "\n",
+    ]
 
-        outfile.write("\n" + "=" * 70 + "\n")
-        outfile.write("STATISTICS\n")
-        outfile.write("=" * 70 + "\n")
-        outfile.write(f"Total items processed: {stats['total_processed']}\n")
-        outfile.write(f"Total errors: {stats['total_errors']}\n")
-        outfile.write(f"Execution time: {stats['elapsed_time']:.6f} seconds\n")
-        outfile.write("=" * 70 + "\n")
-
-        if errors:
-            outfile.write("\nERRORS ENCOUNTERED:\n")
-            outfile.write("-" * 70 + "\n")
-            for error in errors:
-                outfile.write(error + "\n")
+    if results:
+        parts.extend(results)
+    else:
+        parts.append("No valid numbers were processed.")
+
+    parts.append("\n" + SEPARATOR)
+    parts.append("STATISTICS")
+    parts.append(SEPARATOR)
+    parts.append(f"Total items processed: {stats['total_processed']}")
+    parts.append(f"Total errors: {stats['total_errors']}")
+    parts.append(f"Execution time: {stats['elapsed_time']:.6f} seconds")
+    parts.append(SEPARATOR)
+
+    if errors:
+        parts.append("\nERRORS ENCOUNTERED:")
+        parts.append(DASH_LINE)
+        parts.extend(errors)
+
+    # One join and one write instead of a write call per line
+    with open(output_filename, 'w', encoding='utf-8') as outfile:
+        outfile.write("\n".join(parts) + "\n")
 
 
 def display_results(results, stats, output_filename):
@@ -128,9 +150,9 @@ def display_results(results, stats, output_filename):
         stats: Dictionary containing total_processed, total_errors, elapsed_time
         output_filename: Path to output file
     """
-    print("-" * 70)
+    print(DASH_LINE)
     print("\nCONVERSION RESULTS:")
-    print("=" * 70)
+    print(SEPARATOR)
 
     if results:
         # Display first 10 and last 10 results if more than 20
@@ -146,48 +168,121 @@ def display_results(results, stats, output_filename):
     else:
         print("No valid numbers were processed.")
 
-    print("\n" + "=" * 70)
+    print("\n" + SEPARATOR)
     print("STATISTICS")
-    print("=" * 70)
+    print(SEPARATOR)
     print(f"Total items processed: {stats['total_processed']}")
     print(f"Total errors: {stats['total_errors']}")
     print(f"Execution time: {stats['elapsed_time']:.6f} seconds")
-    print("=" * 70)
+    print(SEPARATOR)
 
     print(f"\nResults saved to '{output_filename}'")
 
 
-def process_line(line, line_number, results, errors, stats):
+def parse_lines(lines, start_line=1):
     """
-    Process a single line from the input file.
+    Validate input lines and collect the numbers to convert.
 
     Args:
-        line: Line to process
-        line_number: Current line number
-        results: List to append results to
-        errors: List to append errors to
-        stats: Statistics dictionary to update
+        lines: Iterable of input lines
+        start_line: Line number of the first line in the iterable
+
+    Returns:
+        tuple: (numbers in input order, error messages)
     """
-    # Skip empty lines
-    if not line.strip():
-        return
-
-    success, num, error_msg = validate_and_convert(line)
-
-    if success:
-        # Perform conversions and store result
-        results.append(
-            f"Decimal: {num:>15} | "
-            f"Binary: {decimal_to_binary(num):>20} | "
-            f"Hexadecimal: {decimal_to_hexadecimal(num):>15}"
-        )
-        stats['total_processed'] += 1
-    else:
-        # Handle error
-        error_line = f"Line {line_number}: {error_msg}"
-        errors.append(error_line)
-        print(f"ERROR - {error_line}")
-        stats['total_errors'] += 1
+    numbers = []
+    errors = []
+
+    for line_number, line in enumerate(lines, start=start_line):
+        # Skip empty lines
+        if not line.strip():
+            continue
+
+        success, num, error_msg = validate_and_convert(line)
+
+        if success:
+            numbers.append(num)
+        else:
+            errors.append(f"Line {line_number}: {error_msg}")
+
+    return numbers, errors
+
+
+def process_chunk(chunk):
+    """
+    Parse and convert one chunk of input lines.
+
+    Runs in a worker process, so it only returns data instead of
+    printing or mutating shared state.
+
+    Args:
+        chunk: Tuple of (start_line, lines)
+
+    Returns:
+        tuple: (result strings, error messages)
+    """
+    start_line, lines = chunk
+    numbers, errors = parse_lines(lines, start_line=start_line)
+    binaries, hexadecimals = convert_batch(numbers)
+
+    results = [
+        f"Decimal: {num:>15} | "
+        f"Binary: {binary:>20} | "
+        f"Hexadecimal: {hexadecimal:>15}"
+        for num, binary, hexadecimal
+        in zip(numbers, binaries, hexadecimals)
+    ]
+
+    return results, errors
+
+
+def iter_chunks(infile):
+    """
+    Yield chunks of at most CHUNK_LINES lines from an open file, tagged
+    with the line number each chunk starts at so error messages stay
+    accurate. Only one chunk is held in memory at a time.
+
+    Args:
+        infile: Open file object to read lines from
+
+    Yields:
+        tuple: (start_line, list of lines)
+    """
+    start_line = 1
+    while True:
+        lines = list(islice(infile, CHUNK_LINES))
+        if not lines:
+            return
+        yield (start_line, lines)
+        start_line += len(lines)
+
+
+def convert_chunks(chunks):
+    """
+    Convert an iterable of line chunks, in parallel when the input
+    spans more than one chunk and more than one CPU is available.
+
+    Args:
+        chunks: Iterable of (start_line, lines) tuples
+
+    Returns:
+        list: (results, errors) tuples in chunk order
+    """
+    first = next(chunks, None)
+    if first is None:
+        return []
+
+    second = next(chunks, None)
+    if second is None:
+        # The whole file fit in one chunk; convert in-process
+        return [process_chunk(first)]
+
+    chunks = chain([first, second], chunks)
+    if (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(process_chunk, chunks))
+
+    return [process_chunk(chunk) for chunk in chunks]
 
 
 def process_file(input_filename, output_filename):
@@ -207,16 +302,24 @@ def process_file(input_filename, output_filename):
     stats = {'total_processed': 0, 'total_errors': 0, 'elapsed_time': 0}
 
     try:
-        # Read and process input file
+        print(f"Processing '{input_filename}'...")
+        print(DASH_LINE)
+
+        # Stream the input in fixed-size chunks instead of materializing
+        # every line up front; conversion is independent per line, so
+        # multi-chunk inputs are converted in parallel worker processes
         with open(input_filename, 'r', encoding='utf-8') as infile:
-            lines = infile.readlines()
+            outputs = convert_chunks(iter_chunks(infile))
 
-        print(f"Processing {len(lines)} items from '{input_filename}'...")
-        print("-" * 70)
+        # Flatten in chunk order so results keep the input ordering
+        for chunk_results, chunk_errors in outputs:
+            results.extend(chunk_results)
+            for error_line in chunk_errors:
+                print(f"ERROR - {error_line}")
+            errors.extend(chunk_errors)
 
-        # Process each line
-        for line_number, line in enumerate(lines, start=1):
-            process_line(line, line_number, results, errors, stats)
+        stats['total_processed'] = len(results)
+        stats['total_errors'] = len(errors)
 
         # Calculate elapsed time
         stats['elapsed_time'] = time.time() - start_time
@@ -251,12 +354,12 @@ def main():
     input_filename = sys.argv[1]
     output_filename = "ConvertionResults.txt"
 
-    print("=" * 70)
+    print(SEPARATOR)
     print("NUMBER BASE CONVERTER")
-    print("=" * 70)
+    print(SEPARATOR)
     print(f"Input file: {input_filename}")
     print(f"Output file: {output_filename}")
-    print("=" * 70 + "\n")
+    print(SEPARATOR + "\n")
 
     # Process the file
     process_file(input_filename, output_filename)
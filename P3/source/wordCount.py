@@ -4,19 +4,44 @@ Counts the frequency of distinct words in a text file.
 
 """
 
+import mmap
+import os
+import re
 import sys
 import time
 
+# Words are runs of lowercase letters, digits, or apostrophes (input is
+# lowercased before matching); matching happens on raw bytes so the
+# file never needs a full UTF-8 decode
+WORD_PATTERN = re.compile(rb"[a-z0-9']+")
+
+# Byte-translation table that lowercases the ASCII range
+LOWERCASE_TABLE = bytes(c + 32 if 65 <= c <= 90 else c
+                        for c in range(256))
+
+# Separator lines reused by every output block
+SEPARATOR = "=" * 60
+DASH_LINE = "-" * 60
+
+# A valid word must contain at least one letter
+LETTER_PATTERN = re.compile(rb"[a-z]")
+
 
 def read_file(filename):
     """
-    Read content from a file.
+    Read content from a file as lowercased bytes.
 
     """
     try:
-        with open(filename, 'r', encoding='utf-8') as file_handle:
-            content = file_handle.read()
-        return content
+        with open(filename, 'rb') as file_handle:
+            # Empty files cannot be mmapped
+            if os.fstat(file_handle.fileno()).st_size == 0:
+                return b""
+            # mmap exposes the file without an up-front decode, and the
+            # translate table lowercases the ASCII range in one C pass
+            with mmap.mmap(file_handle.fileno(), 0,
+                           access=mmap.ACCESS_READ) as mapped:
+                return mapped[:].translate(LOWERCASE_TABLE)
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         return None
@@ -28,110 +53,39 @@ def read_file(filename):
         return None
 
 
-def is_valid_word_character(char):
-    """
-    Check if a character is valid for a word (alphanumeric or apostrophe).
-
-    """
-    # Check if alphabetic (a-z, A-Z)
-    if (ord('a') <= ord(char) <= ord('z') or
-            ord('A') <= ord(char) <= ord('Z')):
-        return True
-    # Check if numeric (0-9)
-    if ord('0') <= ord(char) <= ord('9'):
-        return True
-    # Allow apostrophes in words
-    if char == "'":
-        return True
-    return False
-
-
-def to_lowercase(text):
-    """
-    Convert text to lowercase using basic algorithm.
-
-    """
-    result = ""
-    for char in text:
-        if ord('A') <= ord(char) <= ord('Z'):
-            # Convert uppercase to lowercase
-            result += chr(ord(char) + 32)
-        else:
-            result += char
-    return result
-
-
 def extract_words(text):
     """
-    Extract words from text using basic string processing.
+    Extract words from lowercased bytes with a compiled regex.
 
     """
-    words = []
-    current_word = ""
-
-    for char in text:
-        if is_valid_word_character(char):
-            current_word += char
-        else:
-            # End of word
-            if current_word:
-                # Convert to lowercase and add to list
-                lowercase_word = to_lowercase(current_word)
-                words.append(lowercase_word)
-                current_word = ""
-
-    # Don't forget the last word if text doesn't end with separator
-    if current_word:
-        lowercase_word = to_lowercase(current_word)
-        words.append(lowercase_word)
-
-    return words
+    return WORD_PATTERN.findall(text)
 
 
 def count_word_frequencies(words):
     """
     Count frequency of each word using basic algorithm.
     """
-    # Manual frequency counting without using dict
-    unique_words = []
-    frequencies = []
+    # Hash-based counting: one O(1) dict lookup per word instead of a
+    # linear scan over the unique-word list
+    frequencies = {}
 
     for word in words:
         # Skip empty words
         if not word:
             continue
 
-        # Try to validate word contains some alphabetic characters
-        has_letter = False
-        for char in word:
-            if (ord('a') <= ord(char) <= ord('z') or
-                    ord('A') <= ord(char) <= ord('Z')):
-                has_letter = True
-                break
-
-        if not has_letter:
-            print(f"Warning: Skipping invalid word '{word}'")
+        # Try to validate word contains some alphabetic characters;
+        # the compiled regex scans in C with early exit
+        if LETTER_PATTERN.search(word) is None:
+            print(f"Warning: Skipping invalid word '{word.decode('ascii')}'")
             continue
 
-        # Check if word already exists in our list
-        found = False
-        for i, unique_word in enumerate(unique_words):
-            if unique_word == word:
-                frequencies[i] += 1
-                found = True
-                break
-
-        # If not found, add new word
-        if not found:
-            unique_words.append(word)
-            frequencies.append(1)
+        frequencies[word] = frequencies.get(word, 0) + 1
 
-    # Combine into list of tuples
-    word_freq_pairs = []
-    for i, unique_word in enumerate(unique_words):
-        word_freq_pairs.append((unique_word, frequencies[i]))
-
-    return word_freq_pairs
+    # Dicts preserve insertion order, so pairs come out in first-seen
+    # order; only the unique words ever get decoded
+    return [(word.decode('ascii'), freq)
+            for word, freq in frequencies.items()]
 
 
 def sort_word_frequencies(word_freq_pairs):
@@ -139,25 +93,9 @@ def sort_word_frequencies(word_freq_pairs):
     Sort word frequency pairs by frequency (descending), then alphabetically.
 
     """
-    # Create a copy to avoid modifying original
-    sorted_pairs = []
-    for pair in word_freq_pairs:
-        sorted_pairs.append(pair)
-
-    # Bubble sort - sort by frequency descending, then alphabetically
-    n = len(sorted_pairs)
-    for i in range(n):
-        for j in range(0, n - i - 1):
-            # Sort by frequency (descending), then alphabetically
-            if (sorted_pairs[j][1] < sorted_pairs[j + 1][1] or
-                (sorted_pairs[j][1] == sorted_pairs[j + 1][1] and
-                 sorted_pairs[j][0] > sorted_pairs[j + 1][0])):
-                # Swap
-                temp = sorted_pairs[j]
-                sorted_pairs[j] = sorted_pairs[j + 1]
-                sorted_pairs[j + 1] = temp
-
-    return sorted_pairs
+    # Sort by frequency (descending), then alphabetically; sorted() runs
+    # Timsort in C and returns a new list
+    return sorted(word_freq_pairs, key=lambda pair: (-pair[1], pair[0]))
 
 
 def format_results(word_freq_pairs, elapsed_time):
@@ -165,27 +103,29 @@ def format_results(word_freq_pairs, elapsed_time):
     Format results for output.
 
     """
-    output = "=" * 60 + "\n"
-    output += "WORD FREQUENCY ANALYSIS RESULTS\n"
-    output += "=" * 60 + "\n\n"
-
     total_words = 0
     for pair in word_freq_pairs:
         total_words += pair[1]
 
-    output += f"Total words processed: {total_words}\n"
-    output += f"Distinct words found: {len(word_freq_pairs)}\n"
-    output += f"Execution time: {elapsed_time:.4f} seconds\n"
-    output += "\n" + "-" * 60 + "\n"
-    output += f"{'WORD':<30} {'FREQUENCY':>10}\n"
-    output += "-" * 60 + "\n"
+    # Collect lines in a list and join once; += on a string reallocates
+    # the whole buffer for every appended line
+    parts = []
+    parts.append(SEPARATOR)
+    parts.append("WORD FREQUENCY ANALYSIS RESULTS")
+    parts.append(SEPARATOR + "\n")
+    parts.append(f"Total words processed: {total_words}")
+    parts.append(f"Distinct words found: {len(word_freq_pairs)}")
+    parts.append(f"Execution time: {elapsed_time:.4f} seconds\n")
+    parts.append(DASH_LINE)
+    parts.append(f"{'WORD':<30} {'FREQUENCY':>10}")
+    parts.append(DASH_LINE)
 
     for word, frequency in word_freq_pairs:
-        output += f"{word:<30} {frequency:>10}\n"
+        parts.append(f"{word:<30} {frequency:>10}")
 
-    output += "=" * 60 + "\n"
+    parts.append(SEPARATOR)
 
-    return output
+    return "\n".join(parts) + "\n"
 
 
 def write_results_to_file(content, filename):
@@ -194,7 +134,9 @@ def write_results_to_file(content, filename):
 
     """
     try:
-        with open(filename, 'w', encoding='utf-8') as file_handle:
+        # Large buffer so the single write goes out in few syscalls
+        with open(filename, 'w', encoding='utf-8',
+                  buffering=1 << 20) as file_handle:
             file_handle.write(content)
         print(f"\nResults written to '{filename}'")
     except PermissionError:
@@ -214,7 +156,7 @@ def main():
     output_filename = "WordCountResults.txt"
 
     print(f"Processing file: {input_filename}")
-    print("=" * 60)
+    print(SEPARATOR)
 
     # Start timing
     start_time = time.time()